@@ -0,0 +1,191 @@
+"""Async Telegram Bot API client for sending many posts concurrently.
+
+Requires the ``async`` extra (``httpx`` with HTTP/2 support).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import pathlib
+from collections.abc import Awaitable, Callable, Iterable
+
+import httpx
+
+from telegram_post.client import (
+    _BASE_URL,
+    _MAX_RETRIES,
+    _MAX_RETRY_AFTER,
+    PostResult,
+    TelegramAPIError,
+    _api_error,
+    _content_type,
+    _file_digest,
+    _json_loads,
+    _message_body,
+    _photo_data,
+    _PhotoKey,
+    _remember_photo,
+    _retry_after,
+    _to_result,
+    _validate_image,
+)
+from telegram_post.ratelimit import RateLimiter
+
+# Stay well below Telegram's global limit of 30 messages per second.
+_MAX_CONCURRENCY = 20
+
+
+class AsyncTelegramClient:
+    """Async HTTP client for Telegram Bot API.
+
+    Requests share one HTTP/2 connection pool, so concurrent sends cost
+    roughly one round-trip instead of one per message.  Pacing and ``429``
+    handling match :class:`~telegram_post.client.TelegramClient`.
+
+    Usage::
+
+        async with AsyncTelegramClient(bot_token="123:ABC...") as client:
+            results = await client.send_many(
+                [("@mychannel", "Hello!"), ("@mychannel", "World!")],
+            )
+    """
+
+    def __init__(
+        self,
+        bot_token: str,
+        *,
+        limiter: RateLimiter | None = None,
+        dedupe_photos: bool = False,
+    ) -> None:
+        api_url = f"{_BASE_URL}{bot_token}"
+        self._send_message_url = f"{api_url}/sendMessage"
+        self._send_photo_url = f"{api_url}/sendPhoto"
+        self._limiter = limiter or RateLimiter()
+        self._dedupe_photos = dedupe_photos
+        self._sent_photos: dict[_PhotoKey, PostResult] = {}
+        self._client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=_MAX_CONCURRENCY,
+                max_keepalive_connections=_MAX_CONCURRENCY,
+            ),
+        )
+
+    async def __aenter__(self) -> AsyncTelegramClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    async def send_message(
+        self,
+        chat_id: str,
+        text: str,
+        *,
+        parse_mode: str | None = None,
+    ) -> PostResult:
+        """Send a text message to a chat/channel."""
+        body = _message_body(chat_id, text, parse_mode)
+        msg = await self._post(
+            chat_id,
+            lambda: self._client.post(self._send_message_url, json=body),
+        )
+        return _to_result(chat_id, msg)
+
+    async def send_photo(
+        self,
+        chat_id: str,
+        photo_path: pathlib.Path,
+        *,
+        caption: str | None = None,
+        parse_mode: str | None = None,
+    ) -> PostResult:
+        """Send a photo with optional caption to a chat/channel.
+
+        Supports jpg, png, gif, webp up to 10 MB.
+        Raises ``ValueError`` for unsupported format or oversized files.
+        With ``dedupe_photos`` enabled, resending the same file with the
+        same caption to the same chat returns the earlier result instead of
+        posting it again; the client remembers its last 256 photos.  Files
+        are hashed and read in a worker thread so other sends keep running.
+        """
+        _validate_image(photo_path)
+        key = None
+        if self._dedupe_photos:
+            digest = await asyncio.to_thread(_file_digest, photo_path)
+            key = _PhotoKey(chat_id, digest, caption, parse_mode)
+            if key in self._sent_photos:
+                return self._sent_photos[key]
+
+        data = _photo_data(chat_id, caption, parse_mode)
+        content_type = _content_type(photo_path)
+        photo = await asyncio.to_thread(photo_path.read_bytes)
+        msg = await self._post(
+            chat_id,
+            lambda: self._client.post(
+                self._send_photo_url,
+                data=data,
+                files={"photo": (photo_path.name, photo, content_type)},
+            ),
+        )
+        result = _to_result(chat_id, msg)
+        if key is not None:
+            _remember_photo(self._sent_photos, key, result)
+        return result
+
+    async def send_many(
+        self,
+        messages: Iterable[tuple[str, str]],
+        *,
+        parse_mode: str | None = None,
+    ) -> list[PostResult]:
+        """Send ``(chat_id, text)`` pairs concurrently.
+
+        Results are returned in input order.  The first failure is raised
+        once all sends have finished.
+        """
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENCY)
+
+        async def send(chat_id: str, text: str) -> PostResult:
+            async with semaphore:
+                return await self.send_message(
+                    chat_id, text, parse_mode=parse_mode,
+                )
+
+        results = await asyncio.gather(
+            *(send(chat_id, text) for chat_id, text in messages),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    async def _post(
+        self, chat_id: str, send: Callable[[], Awaitable[httpx.Response]],
+    ) -> dict:
+        """Pace and perform a request, waiting out short ``429`` responses.
+
+        Returns the ``result`` object of a successful Bot API response.
+        API and network errors raise
+        :class:`~telegram_post.client.TelegramAPIError`.
+        """
+        for attempt in range(_MAX_RETRIES + 1):
+            await asyncio.sleep(self._limiter.reserve(chat_id))
+            try:
+                resp = await send()
+            except httpx.TransportError as exc:
+                raise TelegramAPIError(str(exc)) from exc
+            if resp.status_code != 429 or attempt == _MAX_RETRIES:
+                break
+            delay = _retry_after(resp.headers, resp.content)
+            if delay > _MAX_RETRY_AFTER:
+                break
+            await asyncio.sleep(delay)
+        if not resp.is_success:
+            raise _api_error(resp.status_code, resp.content)
+        return _json_loads(resp.content)["result"]
@@ -1,14 +1,84 @@
 """CLI entry-point for telegram-post."""
 
-import argparse
+from __future__ import annotations
+
 import pathlib
 import sys
-
-from telegram_post.client import TelegramClient, normalize_channel
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from telegram_post.client import (
+    TelegramClient,
+    normalize_channel,
+    prefetch_api_host,
+)
 from telegram_post.config import ConfigStore, JsonConfigStore, prompt_if_missing
 
+if TYPE_CHECKING:
+    import argparse
+
+_PARSE_MODES = ("HTML", "Markdown", "MarkdownV2")
+# Options taking a value: flag -> (attribute, converter).
+_VALUE_OPTIONS = {
+    "--from-file": ("from_file", pathlib.Path),
+    "--image": ("image", pathlib.Path),
+    "--channel": ("channel", str),
+    "--parse-mode": ("parse_mode", str),
+}
+
+
+def _parse_args(argv: list[str] | None = None) -> SimpleNamespace:
+    """Parse command-line arguments.
+
+    Plain invocations are handled by :func:`_parse_args_fast`; ``argparse``
+    is only imported for ``--help``, abbreviations and error reporting.
+    """
+    args = _parse_args_fast(sys.argv[1:] if argv is None else argv)
+    if args is None:
+        args = _build_parser().parse_args(argv, namespace=SimpleNamespace())
+    return args
+
+
+def _parse_args_fast(argv: list[str]) -> SimpleNamespace | None:
+    """Parse *argv* without argparse, or return ``None`` to defer to it."""
+    values: dict = {
+        "text": None,
+        "from_file": None,
+        "image": None,
+        "channel": None,
+        "parse_mode": None,
+        "reset_keys": False,
+    }
+    tokens = iter(argv)
+    for token in tokens:
+        if token == "--reset-keys":
+            values["reset_keys"] = True
+            continue
+        if not token.startswith("-"):
+            if values["text"] is not None:
+                return None
+            values["text"] = token
+            continue
+        flag, sep, value = token.partition("=")
+        if flag not in _VALUE_OPTIONS:
+            return None
+        if not sep:
+            value = next(tokens, None)
+            if value is None or value.startswith("-"):
+                return None
+        dest, convert = _VALUE_OPTIONS[flag]
+        # argparse checks choices on every occurrence, not just the last.
+        if dest == "parse_mode" and value not in _PARSE_MODES:
+            return None
+        values[dest] = convert(value)
+    if values["channel"] is None:
+        return None
+    return SimpleNamespace(**values)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    import argparse
 
-def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Post a message to a Telegram channel via Bot API.",
     )
@@ -29,7 +99,7 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     )
     parser.add_argument(
         "--parse-mode",
-        choices=["HTML", "Markdown", "MarkdownV2"],
+        choices=_PARSE_MODES,
         help="Message parse mode",
     )
     parser.add_argument(
@@ -37,20 +107,23 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Clear all saved credentials and re-prompt from scratch",
     )
-    return parser.parse_args(argv)
+    return parser
 
 
-def _read_post_text(args: argparse.Namespace) -> str:
+def _read_post_text(args: SimpleNamespace, *, interactive: bool = True) -> str:
     if args.text:
         return args.text
     if args.from_file:
         return args.from_file.read_text(encoding="utf-8").strip()
+    if not interactive:
+        return ""
     print("Enter message text (Ctrl+D to send):")
     return sys.stdin.read().strip()
 
 
 def main(argv: list[str] | None = None, *, _config: ConfigStore | None = None) -> None:
     args = _parse_args(argv)
+    prefetch_api_host()
     config = _config or JsonConfigStore()
 
     if args.reset_keys:
@@ -76,7 +149,8 @@ def main(argv: list[str] | None = None, *, _config: ConfigStore | None = None) -
             print(f"Image not found: {args.image}", file=sys.stderr)
             sys.exit(1)
 
-    text = _read_post_text(args) if not args.image else (args.text or "")
+    # A photo may go without a caption, so never prompt for one.
+    text = _read_post_text(args, interactive=not args.image)
     if not args.image and not text:
         print("Empty message text, aborting.", file=sys.stderr)
         sys.exit(1)
@@ -85,8 +159,6 @@ def main(argv: list[str] | None = None, *, _config: ConfigStore | None = None) -
 
     if args.image:
         caption = text or None
-        if args.from_file and not args.text:
-            caption = args.from_file.read_text(encoding="utf-8").strip() or None
         try:
             result = client.send_photo(
                 channel, args.image, caption=caption, parse_mode=args.parse_mode,
@@ -0,0 +1,93 @@
+"""Client-side pacing for Telegram's Bot API send limits."""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from typing import Callable
+
+_GLOBAL_KEY = "global"
+
+
+class RateLimiter:
+    """Sliding-window limiter shared by all sends of one client.
+
+    Defaults follow the Bot API FAQ: at most ~30 messages per second overall
+    and about one per second to a single chat.  A burst is spread out
+    locally instead of ending in ``429 Too Many Requests``.  Sends to one
+    chat keep their request order; a chat that has sent nothing recently
+    never waits behind another chat's backlog.
+
+    Usage::
+
+        limiter = RateLimiter()
+        time.sleep(limiter.reserve("@mychannel"))
+    """
+
+    def __init__(
+        self,
+        global_limit: int = 30,
+        per_chat_limit: int = 1,
+        period: float = 1.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._global_limit = global_limit
+        self._per_chat_limit = per_chat_limit
+        self._period = period
+        self._clock = clock
+        self._windows: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, chat_id: str) -> float:
+        """Claim the next free send slot for *chat_id*.
+
+        Returns the number of seconds the caller must wait before sending.
+        """
+        with self._lock:
+            now = self._clock()
+            self._drop_idle(now)
+            chat = self._window(chat_id, now)
+            start = max(now, chat[-1]) if chat else now
+            start = self._next_free(chat, start, self._per_chat_limit)
+            # Slots held back by a busy chat can sit ahead of ones for idle
+            # chats, so the global window is kept sorted rather than FIFO.
+            glob = self._window(_GLOBAL_KEY, now)
+            start = self._next_free(glob, start, self._global_limit)
+            chat.append(start)
+            bisect.insort(glob, start)
+            return start - now
+
+    def _drop_idle(self, now: float) -> None:
+        """Forget chats whose every slot has left the window.
+
+        Only chats with a slot in the last period or later survive, so this
+        stays cheap and the limiter does not grow with every chat ever seen.
+        """
+        cutoff = now - self._period
+        idle = [key for key, window in self._windows.items() if window[-1] <= cutoff]
+        for key in idle:
+            del self._windows[key]
+
+    def _window(self, key: str, now: float) -> list[float]:
+        window = self._windows.setdefault(key, [])
+        del window[:bisect.bisect_right(window, now - self._period)]
+        return window
+
+    def _next_free(self, slots: list[float], start: float, limit: int) -> float:
+        """Return the earliest time from *start* that keeps *slots* in limit.
+
+        A slot at ``t`` is free when no period-long window around ``t``
+        already holds *limit* of the sorted *slots*.
+        """
+        while True:
+            lo = bisect.bisect_right(slots, start - self._period)
+            hi = bisect.bisect_left(slots, start + self._period)
+            for i in range(lo, hi - limit + 1):
+                first, last = slots[i], slots[i + limit - 1]
+                if max(start, last) < min(first, start) + self._period:
+                    start = first + self._period
+                    break
+            else:
+                return start
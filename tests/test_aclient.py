@@ -0,0 +1,183 @@
+"""Unit tests for AsyncTelegramClient."""
+
+import asyncio
+import json
+import pathlib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from telegram_post.aclient import AsyncTelegramClient  # noqa: E402
+from telegram_post.client import PostResult, TelegramAPIError  # noqa: E402
+
+
+@pytest.fixture
+def client() -> AsyncTelegramClient:
+    return AsyncTelegramClient(bot_token="123:FAKE")
+
+
+# --- AsyncTelegramClient.send_message ---
+
+
+class TestSendMessage:
+    def test_sends_correct_payload(self, client: AsyncTelegramClient) -> None:
+        with patch.object(client._client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = _ok_response(
+                {"result": {"message_id": 42}},
+            )
+            asyncio.run(client.send_message("@chan", "Hello!", parse_mode="HTML"))
+
+            body = mock_post.call_args.kwargs["json"]
+            assert body == {"chat_id": "@chan", "text": "Hello!", "parse_mode": "HTML"}
+
+    def test_returns_post_result(self, client: AsyncTelegramClient) -> None:
+        with patch.object(client._client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = _ok_response(
+                {"result": {"message_id": 42}},
+            )
+            result = asyncio.run(client.send_message("@mychannel", "test"))
+            assert result == PostResult(message_id=42, url="https://t.me/mychannel/42")
+
+    def test_raises_on_error(self, client: AsyncTelegramClient) -> None:
+        with patch.object(client._client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = _error_response(400)
+            with pytest.raises(TelegramAPIError):
+                asyncio.run(client.send_message("@chan", "bad"))
+
+    @patch("telegram_post.aclient.asyncio.sleep", new_callable=AsyncMock)
+    def test_fails_on_long_flood_wait(
+        self, _sleep: AsyncMock, client: AsyncTelegramClient,
+    ) -> None:
+        with patch.object(client._client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = _error_response(429, retry_after=3600)
+            with pytest.raises(TelegramAPIError) as excinfo:
+                asyncio.run(client.send_message("@chan", "flooded"))
+        assert excinfo.value.status_code == 429
+        assert mock_post.call_count == 1
+
+    def test_error_carries_status(self, client: AsyncTelegramClient) -> None:
+        with patch.object(client._client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = _error_response(400)
+            with pytest.raises(TelegramAPIError) as excinfo:
+                asyncio.run(client.send_message("@chan", "bad"))
+        assert excinfo.value.status_code == 400
+
+    def test_network_error_raises_api_error(
+        self, client: AsyncTelegramClient,
+    ) -> None:
+        with patch.object(client._client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.side_effect = httpx.ConnectError("offline")
+            with pytest.raises(TelegramAPIError) as excinfo:
+                asyncio.run(client.send_message("@chan", "bad"))
+        assert excinfo.value.status_code is None
+
+    @patch("telegram_post.aclient.asyncio.sleep", new_callable=AsyncMock)
+    def test_waits_retry_after_on_429(
+        self, mock_sleep: AsyncMock, client: AsyncTelegramClient,
+    ) -> None:
+        with patch.object(client._client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.side_effect = [
+                _error_response(429, retry_after=7),
+                _ok_response({"result": {"message_id": 5}}),
+            ]
+            result = asyncio.run(client.send_message("@chan", "retry me"))
+        assert result.message_id == 5
+        mock_sleep.assert_any_await(7.0)
+
+
+# --- AsyncTelegramClient.send_photo ---
+
+
+class TestSendPhoto:
+    def test_uploads_photo_with_caption(
+        self, client: AsyncTelegramClient, tmp_path: pathlib.Path,
+    ) -> None:
+        img = tmp_path / "photo.png"
+        img.write_bytes(b"\x89PNG" + b"\x00" * 100)
+        with patch.object(client._client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = _ok_response(
+                {"result": {"message_id": 10}},
+            )
+            result = asyncio.run(client.send_photo("@chan", img, caption="Nice pic"))
+        assert result.message_id == 10
+        assert mock_post.call_args.kwargs["data"]["caption"] == "Nice pic"
+        name, _, content_type = mock_post.call_args.kwargs["files"]["photo"]
+        assert (name, content_type) == ("photo.png", "image/png")
+
+    def test_skips_resend_of_same_photo(self, tmp_path: pathlib.Path) -> None:
+        client = AsyncTelegramClient(bot_token="123:FAKE", dedupe_photos=True)
+        img = tmp_path / "photo.png"
+        img.write_bytes(b"\x89PNG" + b"\x00" * 100)
+
+        async def send_twice() -> tuple[PostResult, PostResult]:
+            first = await client.send_photo("@chan", img, caption="Hi")
+            return first, await client.send_photo("@chan", img, caption="Hi")
+
+        with patch.object(client._client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = _ok_response(
+                {"result": {"message_id": 10}},
+            )
+            first, again = asyncio.run(send_twice())
+        assert again == first
+        assert mock_post.call_count == 1
+
+    def test_rejects_unsupported_format(
+        self, client: AsyncTelegramClient, tmp_path: pathlib.Path,
+    ) -> None:
+        bmp = tmp_path / "image.bmp"
+        bmp.write_bytes(b"\x00" * 100)
+        with pytest.raises(ValueError, match="Unsupported image format"):
+            asyncio.run(client.send_photo("@chan", bmp))
+
+
+# --- AsyncTelegramClient.send_many ---
+
+
+class TestSendMany:
+    def test_returns_results_in_order(self, client: AsyncTelegramClient) -> None:
+        with patch.object(client._client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.side_effect = [
+                _ok_response({"result": {"message_id": 1}}),
+                _ok_response({"result": {"message_id": 2}}),
+            ]
+            results = asyncio.run(
+                client.send_many([("@a", "first"), ("@b", "second")]),
+            )
+        assert [r.url for r in results] == ["https://t.me/a/1", "https://t.me/b/2"]
+
+    def test_raises_after_all_sends(self, client: AsyncTelegramClient) -> None:
+        with patch.object(client._client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.side_effect = [
+                _error_response(400),
+                _ok_response({"result": {"message_id": 2}}),
+            ]
+            with pytest.raises(TelegramAPIError):
+                asyncio.run(client.send_many([("@a", "bad"), ("@b", "good")]))
+            assert mock_post.call_count == 2
+
+
+# --- helpers ---
+
+
+def _ok_response(json_data: dict) -> MagicMock:
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.is_success = True
+    resp.content = json.dumps(json_data).encode()
+    return resp
+
+
+def _error_response(status_code: int, *, retry_after: int = 0) -> MagicMock:
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.is_success = False
+    resp.headers = {}
+    resp.content = json.dumps({
+        "ok": False,
+        "error_code": status_code,
+        "description": "Bad Request: chat not found",
+        "parameters": {"retry_after": retry_after},
+    }).encode()
+    return resp
@@ -1,12 +1,28 @@
 """Unit tests for TelegramClient and CLI."""
 
+import email
+import email.policy
+import gzip
+import json
 import pathlib
+import socket
+import subprocess
+import sys
+from collections.abc import Callable, Iterator
+from email.message import Message
 from unittest.mock import MagicMock, patch
 
 import pytest
+import urllib3
 
-from telegram_post.cli import main
-from telegram_post.client import PostResult, TelegramClient, normalize_channel
+from telegram_post.cli import _build_parser, _parse_args_fast, main
+from telegram_post.client import (
+    PostResult,
+    TelegramAPIError,
+    TelegramClient,
+    _resolve_api_host,
+    normalize_channel,
+)
 
 from helpers import DictConfigStore
 
@@ -16,37 +32,95 @@ def client() -> TelegramClient:
     return TelegramClient(bot_token="123:FAKE")
 
 
+@pytest.fixture(autouse=True)
+def _no_dns_prefetch() -> Iterator[None]:
+    with patch("telegram_post.cli.prefetch_api_host"):
+        yield
+
+
 def _base_config() -> DictConfigStore:
     """Config with bot_token pre-filled."""
     return DictConfigStore({"bot_token": "123:FAKE"})
 
 
+# --- TelegramClient connection pool ---
+
+
+class TestPool:
+    def test_clients_share_pool(self) -> None:
+        first = TelegramClient(bot_token="123:FAKE")
+        second = TelegramClient(bot_token="456:OTHER")
+        assert first._pool is second._pool
+
+    def test_pool_times_out_per_socket_operation(
+        self, client: TelegramClient,
+    ) -> None:
+        timeout = client._pool.connection_pool_kw["timeout"]
+        assert timeout.total is None
+        assert (timeout.connect_timeout, timeout.read_timeout) == (10.0, 30.0)
+
+
 # --- TelegramClient.send_message ---
 
 
 class TestSendMessage:
     def test_sends_correct_payload(self, client: TelegramClient) -> None:
-        with patch.object(client._session, "post") as mock_post:
+        with patch.object(client._pool, "request") as mock_post:
             mock_post.return_value = _ok_response(
                 {"result": {"message_id": 42}},
             )
             client.send_message("@chan", "Hello!")
 
-            body = mock_post.call_args.kwargs["json"]
+            body = json.loads(mock_post.call_args.kwargs["body"])
             assert body == {"chat_id": "@chan", "text": "Hello!"}
 
+    def test_posts_to_send_message_endpoint(self, client: TelegramClient) -> None:
+        with patch.object(client._pool, "request") as mock_post:
+            mock_post.return_value = _ok_response(
+                {"result": {"message_id": 42}},
+            )
+            client.send_message("@chan", "Hello!")
+
+            method, url = mock_post.call_args.args
+            assert (method, url) == (
+                "POST", "https://api.telegram.org/bot123:FAKE/sendMessage",
+            )
+
     def test_includes_parse_mode(self, client: TelegramClient) -> None:
-        with patch.object(client._session, "post") as mock_post:
+        with patch.object(client._pool, "request") as mock_post:
             mock_post.return_value = _ok_response(
                 {"result": {"message_id": 1}},
             )
             client.send_message("@chan", "<b>Bold</b>", parse_mode="HTML")
 
-            body = mock_post.call_args.kwargs["json"]
+            body = json.loads(mock_post.call_args.kwargs["body"])
             assert body["parse_mode"] == "HTML"
 
+    def test_sends_short_body_uncompressed(self, client: TelegramClient) -> None:
+        with patch.object(client._pool, "request") as mock_post:
+            mock_post.return_value = _ok_response(
+                {"result": {"message_id": 1}},
+            )
+            client.send_message("@chan", "short")
+
+            headers = mock_post.call_args.kwargs["headers"]
+            assert "Content-Encoding" not in headers
+
+    def test_gzips_long_body(self, client: TelegramClient) -> None:
+        text = "log line\n" * 300
+        with patch.object(client._pool, "request") as mock_post:
+            mock_post.return_value = _ok_response(
+                {"result": {"message_id": 1}},
+            )
+            client.send_message("@chan", text)
+
+            kwargs = mock_post.call_args.kwargs
+            assert kwargs["headers"]["Content-Encoding"] == "gzip"
+            assert _sent_json(kwargs) == {"chat_id": "@chan", "text": text}
+            assert len(kwargs["body"]) < len(text)
+
     def test_returns_post_result(self, client: TelegramClient) -> None:
-        with patch.object(client._session, "post") as mock_post:
+        with patch.object(client._pool, "request") as mock_post:
             mock_post.return_value = _ok_response(
                 {"result": {"message_id": 42}},
             )
@@ -56,22 +130,171 @@ class TestSendMessage:
             assert result.url == "https://t.me/mychannel/42"
 
     def test_raises_on_400(self, client: TelegramClient) -> None:
-        with patch.object(client._session, "post") as mock_post:
+        with patch.object(client._pool, "request") as mock_post:
             mock_post.return_value = _error_response(400)
-            with pytest.raises(Exception):
+            with pytest.raises(TelegramAPIError):
+                client.send_message("@chan", "bad")
+
+    def test_error_uses_telegram_description(self, client: TelegramClient) -> None:
+        with patch.object(client._pool, "request") as mock_post:
+            mock_post.return_value = _error_response(400)
+            with pytest.raises(TelegramAPIError, match="^400: Bad Request: chat not found$"):
+                client.send_message("@chan", "bad")
+
+    def test_error_carries_status_and_body(self, client: TelegramClient) -> None:
+        resp = _error_response(403)
+        with patch.object(client._pool, "request") as mock_post:
+            mock_post.return_value = resp
+            with pytest.raises(TelegramAPIError) as excinfo:
+                client.send_message("@chan", "bad")
+        assert excinfo.value.status_code == 403
+        assert excinfo.value.body == resp.data
+
+    def test_network_error_raises_api_error(self, client: TelegramClient) -> None:
+        with patch.object(client._pool, "request") as mock_post:
+            mock_post.side_effect = urllib3.exceptions.MaxRetryError(
+                client._pool, "/sendMessage",
+            )
+            with pytest.raises(TelegramAPIError) as excinfo:
+                client.send_message("@chan", "offline")
+        assert excinfo.value.status_code is None
+
+    def test_error_falls_back_to_raw_body(self, client: TelegramClient) -> None:
+        resp = _error_response(502)
+        resp.data = b"<html>Bad Gateway</html>"
+        with patch.object(client._pool, "request") as mock_post:
+            mock_post.return_value = resp
+            with pytest.raises(TelegramAPIError, match="^502: <html>Bad Gateway</html>$"):
                 client.send_message("@chan", "bad")
 
     def test_raises_on_403(self, client: TelegramClient) -> None:
-        with patch.object(client._session, "post") as mock_post:
+        with patch.object(client._pool, "request") as mock_post:
             mock_post.return_value = _error_response(403)
-            with pytest.raises(Exception):
+            with pytest.raises(TelegramAPIError):
                 client.send_message("@chan", "forbidden")
 
-    def test_raises_on_429(self, client: TelegramClient) -> None:
-        with patch.object(client._session, "post") as mock_post:
+    @patch("telegram_post.client.time.sleep")
+    def test_raises_on_429(
+        self, _sleep: MagicMock, client: TelegramClient,
+    ) -> None:
+        with patch.object(client._pool, "request") as mock_post:
             mock_post.return_value = _error_response(429)
-            with pytest.raises(Exception):
+            with pytest.raises(TelegramAPIError):
                 client.send_message("@chan", "rate limited")
+            assert mock_post.call_count == 4
+
+    @patch("telegram_post.client.time.sleep")
+    def test_waits_retry_after_on_429(
+        self, mock_sleep: MagicMock, client: TelegramClient,
+    ) -> None:
+        with patch.object(client._pool, "request") as mock_post:
+            mock_post.side_effect = [
+                _error_response(429, retry_after=7),
+                _ok_response({"result": {"message_id": 5}}),
+            ]
+            result = client.send_message("@chan", "retry me")
+        assert result.message_id == 5
+        mock_sleep.assert_any_call(7.0)
+
+    @patch("telegram_post.client.time.sleep")
+    def test_negative_retry_after_does_not_wait(
+        self, mock_sleep: MagicMock, client: TelegramClient,
+    ) -> None:
+        limited = _error_response(429)
+        limited.headers = {"Retry-After": "-1"}
+        with patch.object(client._pool, "request") as mock_post:
+            mock_post.side_effect = [
+                limited, _ok_response({"result": {"message_id": 5}}),
+            ]
+            result = client.send_message("@chan", "retry me")
+        assert result.message_id == 5
+        assert all(call.args[0] >= 0 for call in mock_sleep.call_args_list)
+
+    @pytest.mark.parametrize("retry_after", ["3600", "inf"])
+    @patch("telegram_post.client.time.sleep")
+    def test_fails_on_long_flood_wait(
+        self, mock_sleep: MagicMock, client: TelegramClient, retry_after: str,
+    ) -> None:
+        limited = _error_response(429)
+        limited.headers = {"Retry-After": retry_after}
+        with patch.object(client._pool, "request") as mock_post:
+            mock_post.return_value = limited
+            with pytest.raises(TelegramAPIError) as excinfo:
+                client.send_message("@chan", "flooded")
+        assert excinfo.value.status_code == 429
+        assert mock_post.call_count == 1
+        assert all(call.args[0] < 60 for call in mock_sleep.call_args_list)
+
+    @patch("telegram_post.client.time.sleep")
+    def test_prefers_retry_after_header(
+        self, mock_sleep: MagicMock, client: TelegramClient,
+    ) -> None:
+        limited = _error_response(429, retry_after=7)
+        limited.headers = {"Retry-After": "3"}
+        with patch.object(client._pool, "request") as mock_post:
+            mock_post.side_effect = [
+                limited, _ok_response({"result": {"message_id": 5}}),
+            ]
+            client.send_message("@chan", "retry me")
+        mock_sleep.assert_any_call(3.0)
+
+
+# --- TelegramClient.send_batch ---
+
+
+@patch("telegram_post.client.time.sleep")
+class TestSendBatch:
+    def test_joins_short_texts(
+        self, _sleep: MagicMock, client: TelegramClient,
+    ) -> None:
+        with patch.object(client._pool, "request") as mock_post:
+            mock_post.return_value = _ok_response(
+                {"result": {"message_id": 7}},
+            )
+            results = client.send_batch("@chan", ["one", "two", "three"])
+        assert len(results) == 1
+        assert json.loads(mock_post.call_args.kwargs["body"])["text"] == "one\ntwo\nthree"
+
+    def test_splits_at_message_limit(
+        self, _sleep: MagicMock, client: TelegramClient,
+    ) -> None:
+        texts = ["a" * 2000, "b" * 2095, "c" * 10]
+        with patch.object(client._pool, "request") as mock_post:
+            mock_post.return_value = _ok_response(
+                {"result": {"message_id": 7}},
+            )
+            results = client.send_batch("@chan", texts, parse_mode="HTML")
+        sent = [_sent_json(c.kwargs) for c in mock_post.call_args_list]
+        assert len(results) == 2
+        assert sent[0]["text"] == "a" * 2000 + "\n" + "b" * 2095
+        assert sent[1]["text"] == "c" * 10
+        assert all(body["parse_mode"] == "HTML" for body in sent)
+
+    def test_counts_length_in_utf16_units(
+        self, _sleep: MagicMock, client: TelegramClient,
+    ) -> None:
+        texts = ["\N{GRINNING FACE}" * 1500, "\N{GRINNING FACE}" * 1000]
+        with patch.object(client._pool, "request") as mock_post:
+            mock_post.return_value = _ok_response(
+                {"result": {"message_id": 7}},
+            )
+            results = client.send_batch("@chan", texts)
+        assert len(results) == 2
+
+    def test_rejects_oversized_text_before_sending(
+        self, _sleep: MagicMock, client: TelegramClient,
+    ) -> None:
+        with patch.object(client._pool, "request") as mock_post:
+            with pytest.raises(ValueError, match="^Text 1 too long"):
+                client.send_batch("@chan", ["a" * 10, "b" * 5000, "c"])
+        mock_post.assert_not_called()
+
+    def test_sends_nothing_for_no_texts(
+        self, _sleep: MagicMock, client: TelegramClient,
+    ) -> None:
+        with patch.object(client._pool, "request") as mock_post:
+            assert client.send_batch("@chan", []) == []
+        mock_post.assert_not_called()
 
 
 # --- TelegramClient.send_photo ---
@@ -83,26 +306,121 @@ class TestSendPhoto:
     ) -> None:
         img = tmp_path / "photo.jpg"
         img.write_bytes(b"\xff\xd8" + b"\x00" * 100)
-        with patch.object(client._session, "post") as mock_post:
-            mock_post.return_value = _ok_response(
-                {"result": {"message_id": 10}},
-            )
+        sent, request = _record_uploads(
+            _ok_response({"result": {"message_id": 10}}),
+        )
+        with patch.object(client._pool, "request", side_effect=request):
             result = client.send_photo("@chan", img)
         assert result.message_id == 10
-        assert mock_post.call_args.kwargs["files"]["photo"] is not None
+        [(headers, body)] = sent
+        assert headers["Content-Type"].startswith("multipart/form-data")
+        photo = _form_parts(headers, body)["photo"]
+        assert photo.get_filename() == "photo.jpg"
+        assert photo.get_content_type() == "image/jpeg"
+
+    def test_content_type_ignores_suffix_case(
+        self, client: TelegramClient, tmp_path: pathlib.Path,
+    ) -> None:
+        img = tmp_path / "photo.WEBP"
+        img.write_bytes(b"RIFF" + b"\x00" * 100)
+        sent, request = _record_uploads(
+            _ok_response({"result": {"message_id": 11}}),
+        )
+        with patch.object(client._pool, "request", side_effect=request):
+            client.send_photo("@chan", img)
+        [(headers, body)] = sent
+        assert _form_parts(headers, body)["photo"].get_content_type() == "image/webp"
+
+    @pytest.mark.parametrize("repeat", [100, 8 * 1024])  # ~25 KB, ~2 MB (mmap)
+    def test_streams_whole_file(
+        self, client: TelegramClient, tmp_path: pathlib.Path, repeat: int,
+    ) -> None:
+        img = tmp_path / "photo.jpg"
+        payload = b"\xff\xd8" + bytes(range(256)) * repeat
+        img.write_bytes(payload)
+        sent, request = _record_uploads(
+            _ok_response({"result": {"message_id": 10}}),
+        )
+        with patch.object(client._pool, "request", side_effect=request):
+            client.send_photo("@chan", img)
+        [(headers, body)] = sent
+        assert int(headers["Content-Length"]) == len(body)
+        photo = _form_parts(headers, body)["photo"]
+        assert photo.get_payload(decode=True) == payload
 
     def test_includes_caption(
         self, client: TelegramClient, tmp_path: pathlib.Path,
     ) -> None:
         img = tmp_path / "photo.png"
         img.write_bytes(b"\x89PNG" + b"\x00" * 100)
-        with patch.object(client._session, "post") as mock_post:
+        sent, request = _record_uploads(
+            _ok_response({"result": {"message_id": 11}}),
+        )
+        with patch.object(client._pool, "request", side_effect=request):
+            client.send_photo("@chan", img, caption="Nice pic")
+        [(headers, body)] = sent
+        caption = _form_parts(headers, body)["caption"]
+        assert caption.get_payload(decode=True) == b"Nice pic"
+
+    def test_skips_resend_of_same_photo(self, tmp_path: pathlib.Path) -> None:
+        client = TelegramClient(bot_token="123:FAKE", dedupe_photos=True)
+        img = tmp_path / "photo.jpg"
+        img.write_bytes(b"\xff\xd8" + b"\x00" * 100)
+        copy = tmp_path / "copy.jpg"
+        copy.write_bytes(img.read_bytes())
+        with patch.object(client._pool, "request") as mock_post:
             mock_post.return_value = _ok_response(
-                {"result": {"message_id": 11}},
+                {"result": {"message_id": 10}},
             )
-            client.send_photo("@chan", img, caption="Nice pic")
-            data = mock_post.call_args.kwargs["data"]
-            assert data["caption"] == "Nice pic"
+            first = client.send_photo("@chan", img, caption="Hi")
+            again = client.send_photo("@chan", copy, caption="Hi")
+        assert again == first
+        assert mock_post.call_count == 1
+
+    @patch("telegram_post.client.time.sleep")
+    def test_resends_same_photo_by_default(
+        self, _sleep: MagicMock, client: TelegramClient, tmp_path: pathlib.Path,
+    ) -> None:
+        img = tmp_path / "photo.jpg"
+        img.write_bytes(b"\xff\xd8" + b"\x00" * 100)
+        with patch.object(client._pool, "request") as mock_post:
+            mock_post.return_value = _ok_response(
+                {"result": {"message_id": 10}},
+            )
+            client.send_photo("@chan", img, caption="Hi")
+            client.send_photo("@chan", img, caption="Hi")
+        assert mock_post.call_count == 2
+
+    @patch("telegram_post.client.time.sleep")
+    @patch("telegram_post.client._MAX_SENT_PHOTOS", 1)
+    def test_forgets_oldest_photo(
+        self, _sleep: MagicMock, tmp_path: pathlib.Path,
+    ) -> None:
+        client = TelegramClient(bot_token="123:FAKE", dedupe_photos=True)
+        img = tmp_path / "photo.jpg"
+        img.write_bytes(b"\xff\xd8" + b"\x00" * 100)
+        with patch.object(client._pool, "request") as mock_post:
+            mock_post.return_value = _ok_response(
+                {"result": {"message_id": 10}},
+            )
+            for caption in ("one", "two", "one"):
+                client.send_photo("@chan", img, caption=caption)
+        assert mock_post.call_count == 3
+        assert len(client._sent_photos) == 1
+
+    @patch("telegram_post.client.time.sleep")
+    def test_resends_with_different_caption(
+        self, _sleep: MagicMock, client: TelegramClient, tmp_path: pathlib.Path,
+    ) -> None:
+        img = tmp_path / "photo.jpg"
+        img.write_bytes(b"\xff\xd8" + b"\x00" * 100)
+        with patch.object(client._pool, "request") as mock_post:
+            mock_post.return_value = _ok_response(
+                {"result": {"message_id": 10}},
+            )
+            client.send_photo("@chan", img, caption="Hi")
+            client.send_photo("@chan", img, caption="Hi again")
+        assert mock_post.call_count == 2
 
     def test_rejects_unsupported_format(
         self, client: TelegramClient, tmp_path: pathlib.Path,
@@ -120,14 +438,32 @@ class TestSendPhoto:
         with pytest.raises(ValueError, match="Image too large"):
             client.send_photo("@chan", big)
 
+    @patch("telegram_post.client.time.sleep")
+    def test_reuploads_after_429(
+        self, _sleep: MagicMock, client: TelegramClient, tmp_path: pathlib.Path,
+    ) -> None:
+        img = tmp_path / "photo.jpg"
+        payload = b"\xff\xd8" + b"\x01" * 100
+        img.write_bytes(payload)
+        sent, request = _record_uploads(
+            _error_response(429),
+            _ok_response({"result": {"message_id": 12}}),
+        )
+        with patch.object(client._pool, "request", side_effect=request):
+            result = client.send_photo("@chan", img)
+        assert result.message_id == 12
+        assert len(sent) == 2
+        for headers, body in sent:
+            assert _form_parts(headers, body)["photo"].get_payload(decode=True) == payload
+
     def test_raises_on_api_error(
         self, client: TelegramClient, tmp_path: pathlib.Path,
     ) -> None:
         img = tmp_path / "pic.jpg"
         img.write_bytes(b"\xff\xd8" + b"\x00" * 100)
-        with patch.object(client._session, "post") as mock_post:
+        with patch.object(client._pool, "request") as mock_post:
             mock_post.return_value = _error_response(400)
-            with pytest.raises(Exception):
+            with pytest.raises(TelegramAPIError):
                 client.send_photo("@chan", img)
 
 
@@ -145,6 +481,23 @@ class TestNormalizeChannel:
         assert normalize_channel("12345") == "@12345"
 
 
+# --- _resolve_api_host ---
+
+
+class TestResolveApiHost:
+    @patch("telegram_post.client.socket.getaddrinfo")
+    def test_resolves_api_host(self, mock_getaddrinfo: MagicMock) -> None:
+        _resolve_api_host()
+        assert mock_getaddrinfo.call_args.args[:2] == ("api.telegram.org", 443)
+
+    @patch(
+        "telegram_post.client.socket.getaddrinfo",
+        side_effect=socket.gaierror("offline"),
+    )
+    def test_ignores_lookup_failure(self, _getaddrinfo: MagicMock) -> None:
+        _resolve_api_host()
+
+
 # --- CLI ---
 
 
@@ -196,6 +549,33 @@ class TestCLIOutput:
             "@mychan", img, caption=None, parse_mode=None,
         )
 
+    @patch("telegram_post.cli.TelegramClient")
+    def test_sends_photo_with_caption_from_file(
+        self, mock_client_cls: MagicMock,
+        tmp_path: pathlib.Path,
+    ) -> None:
+        img = tmp_path / "photo.jpg"
+        img.write_bytes(b"\xff\xd8" + b"\x00" * 100)
+        draft = tmp_path / "draft.txt"
+        draft.write_text("From file\n", encoding="utf-8")
+
+        mock_client = mock_client_cls.return_value
+        mock_client.send_photo.return_value = PostResult(
+            message_id=57, url="https://t.me/mychan/57",
+        )
+        read_text = pathlib.Path.read_text
+        with patch.object(
+            pathlib.Path, "read_text", autospec=True, side_effect=read_text,
+        ) as read:
+            main(
+                ["--channel", "mychan", "--image", str(img), "--from-file", str(draft)],
+                _config=_base_config(),
+            )
+        mock_client.send_photo.assert_called_once_with(
+            "@mychan", img, caption="From file", parse_mode=None,
+        )
+        assert read.call_count == 1
+
     @patch("telegram_post.cli.TelegramClient")
     def test_passes_parse_mode(
         self, mock_client_cls: MagicMock,
@@ -210,6 +590,62 @@ class TestCLIOutput:
         )
 
 
+class TestCLIParsing:
+    @pytest.mark.parametrize("argv", [
+        ["--channel", "ch", "Hello!"],
+        ["Hello!", "--channel=@ch", "--parse-mode", "HTML"],
+        ["--channel", "ch", "--image", "a.png", "--from-file", "b.txt"],
+        ["--channel", "ch", "--reset-keys", "--channel", "other"],
+        ["--channel", "ch", ""],
+    ])
+    def test_fast_path_matches_argparse(self, argv: list[str]) -> None:
+        fast = _parse_args_fast(argv)
+        assert fast is not None
+        assert vars(fast) == vars(_build_parser().parse_args(argv))
+
+    @pytest.mark.parametrize("argv", [
+        ["--help"],
+        ["-h"],
+        ["--chan", "ch", "hi"],
+        ["--channel", "-100123", "hi"],
+        ["--channel", "ch", "--", "-text"],
+        ["--channel", "ch", "one", "two"],
+        ["--channel"],
+        ["hi"],
+        ["--channel", "ch", "--parse-mode", "BBCode", "hi"],
+        ["--parse-mode", "BBCode", "--parse-mode", "HTML", "--channel", "ch"],
+        ["--channel", "ch", "--reset-keys=yes"],
+    ])
+    def test_defers_to_argparse(self, argv: list[str]) -> None:
+        assert _parse_args_fast(argv) is None
+
+
+class TestCLIStartup:
+    def test_parsing_does_not_load_argparse(self) -> None:
+        code = (
+            "import sys; from telegram_post.cli import _parse_args; "
+            "_parse_args(['--channel', 'ch', 'hi']); print('argparse' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        ).stdout
+        assert out.strip() == "False"
+
+    def test_import_does_not_load_hashlib(self) -> None:
+        code = "import sys, telegram_post.cli; print('hashlib' in sys.modules)"
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        ).stdout
+        assert out.strip() == "False"
+
+    def test_import_does_not_load_urllib3(self) -> None:
+        code = "import sys, telegram_post.cli; print('urllib3' in sys.modules)"
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        ).stdout
+        assert out.strip() == "False"
+
+
 class TestCLIValidation:
     def test_rejects_empty_text(self) -> None:
         with pytest.raises(SystemExit), patch("sys.stdin") as mock_stdin:
@@ -232,16 +668,53 @@ class TestCLIValidation:
 
 def _ok_response(json_data: dict) -> MagicMock:
     resp = MagicMock()
-    resp.status_code = 200
-    resp.ok = True
-    resp.json.return_value = json_data
-    resp.raise_for_status.return_value = None
+    resp.status = 200
+    resp.data = json.dumps(json_data).encode()
     return resp
 
 
-def _error_response(status_code: int) -> MagicMock:
+def _error_response(status_code: int, *, retry_after: int = 0) -> MagicMock:
     resp = MagicMock()
-    resp.status_code = status_code
-    resp.ok = False
-    resp.text = "error"
+    resp.status = status_code
+    resp.headers = {}
+    resp.data = json.dumps({
+        "ok": False,
+        "error_code": status_code,
+        "description": "Bad Request: chat not found",
+        "parameters": {"retry_after": retry_after},
+    }).encode()
     return resp
+
+
+def _sent_json(kwargs: dict) -> dict:
+    body = kwargs["body"]
+    if kwargs["headers"].get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    return json.loads(body)
+
+
+def _record_uploads(
+    *responses: MagicMock,
+) -> tuple[list[tuple[dict, bytes]], Callable[..., MagicMock]]:
+    """Side effect for ``PoolManager.request`` that drains streamed bodies.
+
+    Returns the list of recorded ``(headers, body)`` pairs and the side effect,
+    which answers with *responses* in order, repeating the last one.
+    """
+    sent: list[tuple[dict, bytes]] = []
+    queue = list(responses)
+
+    def request(_method: str, _url: str, *, body: object, headers: dict) -> MagicMock:
+        sent.append((headers, body if isinstance(body, bytes) else b"".join(body)))
+        return queue.pop(0) if len(queue) > 1 else queue[0]
+
+    return sent, request
+
+
+def _form_parts(headers: dict, body: bytes) -> dict[str, Message]:
+    raw = f"Content-Type: {headers['Content-Type']}\r\n\r\n".encode() + body
+    msg = email.message_from_bytes(raw, policy=email.policy.HTTP)
+    return {
+        part.get_param("name", header="content-disposition"): part
+        for part in msg.iter_parts()
+    }
@@ -0,0 +1,55 @@
+"""Tests for RateLimiter."""
+
+from telegram_post.ratelimit import RateLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRateLimiter:
+    def test_first_send_is_immediate(self) -> None:
+        limiter = RateLimiter(clock=FakeClock())
+        assert limiter.reserve("@chan") == 0
+
+    def test_paces_same_chat(self) -> None:
+        limiter = RateLimiter(per_chat_limit=1, period=1.0, clock=FakeClock())
+        assert limiter.reserve("@chan") == 0
+        assert limiter.reserve("@chan") == 1.0
+        assert limiter.reserve("@chan") == 2.0
+
+    def test_other_chats_are_not_delayed(self) -> None:
+        limiter = RateLimiter(per_chat_limit=1, period=1.0, clock=FakeClock())
+        delays = [limiter.reserve(chat) for chat in ("@a", "@a", "@a", "@b", "@c")]
+        assert delays == [0, 1.0, 2.0, 0, 0]
+
+    def test_global_limit_fills_gaps_left_by_busy_chat(self) -> None:
+        limiter = RateLimiter(global_limit=2, period=1.0, clock=FakeClock())
+        assert [limiter.reserve("@a") for _ in range(3)] == [0, 1.0, 2.0]
+        assert [limiter.reserve(chat) for chat in ("@b", "@c")] == [0, 1.0]
+
+    def test_enforces_global_limit(self) -> None:
+        limiter = RateLimiter(global_limit=2, period=1.0, clock=FakeClock())
+        assert limiter.reserve("@a") == 0
+        assert limiter.reserve("@b") == 0
+        assert limiter.reserve("@c") == 1.0
+
+    def test_slots_free_up_over_time(self) -> None:
+        clock = FakeClock()
+        limiter = RateLimiter(per_chat_limit=1, period=1.0, clock=clock)
+        limiter.reserve("@chan")
+        clock.now += 1.5
+        assert limiter.reserve("@chan") == 0
+
+    def test_forgets_idle_chats(self) -> None:
+        clock = FakeClock()
+        limiter = RateLimiter(period=1.0, clock=clock)
+        for i in range(10):
+            limiter.reserve(f"@chat{i}")
+        clock.now += 1.5
+        limiter.reserve("@chat0")
+        assert set(limiter._windows) == {"global", "@chat0"}